@@ -1,13 +1,17 @@
 ### app.py ###
 from __future__ import annotations
 import sys
+import threading
 from PyQt6.QtWidgets import QApplication
+from functions import preload_backends
 from pyqt.theme import apply_theme
 from pyqt.window import MainWindow
 
 
 def main() -> int:
     """Application entry point."""
+    # Warm heavy imports while the window is built
+    threading.Thread(target=preload_backends, daemon=True).start()
     app = QApplication(sys.argv)
     apply_theme(app)
     window = MainWindow()
@@ -1,36 +1,68 @@
 """Core Piper TTS functionality."""
 from __future__ import annotations
 
-import io
+import dataclasses
+import functools
+import json
 import os
 import shutil
-import sys
 import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
 
 import numpy as np
-import sounddevice as sd
-from piper import PiperVoice
-from piper.config import SynthesisConfig
-import piper.download_voices as piper_dl
 
+# sounddevice, piper and onnxruntime are imported on first use: they open
+# PortAudio and load ONNX Runtime (and CUDA libs), which delays startup
 if TYPE_CHECKING:
+    import sounddevice as sd
+    from onnxruntime import InferenceSession
+    from piper import PiperVoice
+    from piper.config import SynthesisConfig
     from PyQt6.QtCore import QObject
 
 # Audio configuration
-sd.default.dtype = "int16" #type: ignore
-sd.default.blocksize = 0
-sd.default.latency = "low" #type: ignore
+AUDIO_BLOCKSIZE = 2048
+AUDIO_LATENCY = "low"
 
 # Models directory
 MODELS_DIR = Path(os.getenv("PIPER_MODELS_DIR", "models"))
 MODELS_DIR.mkdir(parents=True, exist_ok=True)
 
+# Derived models (e.g. FP16 copies for CUDA); kept out of list_models()
+CACHE_DIR = MODELS_DIR / ".cache"
+
+# Suffix for dynamically quantized INT8 copies of voice models
+INT8_SUFFIX = ".int8.onnx"
+
+# Models directory listing: (dir mtime_ns, file names, sorted model names)
+_MODELS_DIR_CACHE: tuple[int, frozenset[str], list[str]] | None = None
+
+# Socket timeout (seconds) for voice downloads
+DOWNLOAD_TIMEOUT = 30
+
+# Generous speech rate (seconds per word at speed 1.0) for sizing audio buffers
+SECONDS_PER_WORD = 0.5
+
+# Weight-carrying ops that dynamic INT8 quantization rewrites, mapped to the
+# (start, stop) range of their inputs that can hold the weight
+QUANTIZABLE_OPS = {"Conv": (1, 2), "MatMul": (0, 2), "Gather": (0, 1)}
+
 # CUDA support detection
 _CUDA_AVAILABLE: bool | None = None
 
 
+def preload_backends() -> None:
+    """Import the heavy audio/inference modules ahead of first use."""
+    try:
+        import onnxruntime  # noqa: F401
+        import piper  # noqa: F401
+        import sounddevice  # noqa: F401
+    except Exception:
+        pass
+
+
 def is_cuda_available() -> bool:
     """Check if CUDA is available via ONNX Runtime."""
     global _CUDA_AVAILABLE
@@ -69,17 +101,192 @@ def get_cuda_info() -> dict[str, str | bool]:
     return info
 
 
+def _scan_models_dir() -> tuple[frozenset[str], list[str]]:
+    """Return (file names, sorted model names), rescanning only on dir change."""
+    global _MODELS_DIR_CACHE
+    
+    mtime = os.stat(MODELS_DIR).st_mtime_ns
+    if _MODELS_DIR_CACHE is None or _MODELS_DIR_CACHE[0] != mtime:
+        with os.scandir(MODELS_DIR) as it:
+            files = frozenset(e.name for e in it if e.is_file())
+        models = sorted(n for n in files if n.endswith(".onnx"))
+        _MODELS_DIR_CACHE = (mtime, files, models)
+    
+    return _MODELS_DIR_CACHE[1], _MODELS_DIR_CACHE[2]
+
+
 def list_models() -> list[str]:
     """List available voice models."""
-    models = sorted(p.name for p in MODELS_DIR.glob("*.onnx"))
-    return models or ["No models"]
+    _, models = _scan_models_dir()
+    return list(models) or ["No models"]
 
 
 def get_config_path(model_path: Path) -> Path:
-    """Get config path for a model file."""
+    """Get config path for a model file (INT8 copies share the original's)."""
+    if model_path.name.endswith(INT8_SUFFIX):
+        model_path = model_path.with_name(model_path.name[: -len(INT8_SUFFIX)] + ".onnx")
     return model_path.with_suffix(model_path.suffix + ".json")
 
 
+def quantize_model(model_path: Path) -> Path:
+    """Write an INT8 dynamically quantized copy of a model. Returns its path."""
+    import onnx
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    out_path = model_path.with_name(model_path.stem + INT8_SUFFIX)
+
+    # Keep the first and last weight layers in full precision. A node counts
+    # as a weight layer only if its weight operand is an initializer: Piper's
+    # graph starts with Gathers on the `scales` input, which hold no weights
+    # (only their constant indices are initializers).
+    graph = onnx.load(str(model_path)).graph
+    inits = {i.name for i in graph.initializer}
+    weighted = [
+        n.name
+        for n in graph.node
+        if n.op_type in QUANTIZABLE_OPS
+        and any(inp in inits for inp in n.input[slice(*QUANTIZABLE_OPS[n.op_type])])
+    ]
+    exclude = list({weighted[0], weighted[-1]}) if weighted else []
+
+    quantize_dynamic(
+        model_path,
+        out_path,
+        weight_type=QuantType.QInt8,
+        nodes_to_exclude=exclude,
+    )
+    return out_path
+
+
+def quantize_voice_model(model_name: str) -> tuple[bool, str]:
+    """Create an INT8 copy of a voice model. Returns (success, message)."""
+    model_path = MODELS_DIR / model_name
+    if model_name.endswith(INT8_SUFFIX):
+        return False, f"Already quantized: {model_name}"
+    if not model_path.exists():
+        return False, f"Model not found: {model_name}"
+
+    try:
+        out_path = quantize_model(model_path)
+        return True, f"Quantized: {out_path.name}"
+    except ImportError as e:
+        return False, f"Quantization requires onnx: {e}"
+    except Exception as e:
+        return False, f"Quantize error: {e}"
+
+
+def _physical_cores() -> int:
+    """Physical CPU core count, or 0 to let ONNX Runtime decide."""
+    try:
+        import psutil
+        return psutil.cpu_count(logical=False) or 0
+    except ImportError:
+        # ONNX Runtime already defaults to the physical core count
+        return 0
+
+
+def _fp16_model_path(model_path: str) -> str:
+    """Return an FP16 copy of a model for CUDA, converting it once if needed.
+
+    Falls back to the original model if onnxconverter-common is not installed
+    or the conversion fails. INT8 models are used as-is.
+    """
+    src = Path(model_path)
+    if src.name.endswith(INT8_SUFFIX):
+        return model_path
+
+    # The cached copy carries the source's mtime; any difference means the
+    # model was replaced (copy2 keeps the new file's older mtime, so >= won't do)
+    dst = CACHE_DIR / f"{src.stem}.fp16.onnx"
+    src_stat = src.stat()
+    if dst.exists() and dst.stat().st_mtime_ns == src_stat.st_mtime_ns:
+        return str(dst)
+
+    try:
+        import onnx
+        from onnxconverter_common import float16
+
+        model = float16.convert_float_to_float16(onnx.load(str(src)), keep_io_types=True)
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        onnx.save(model, str(dst))
+        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        return str(dst)
+    except Exception:
+        return model_path
+
+
+def _create_session(model_path: str, use_cuda: bool) -> InferenceSession:
+    """Create a tuned ONNX Runtime session for a voice model."""
+    import onnxruntime as ort
+
+    opts = ort.SessionOptions()
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    opts.intra_op_num_threads = _physical_cores()
+    opts.enable_cpu_mem_arena = True
+
+    providers: list[str | tuple[str, dict[str, str | bool]]]
+    if use_cuda:
+        providers = [
+            (
+                "CUDAExecutionProvider",
+                {
+                    # Input lengths vary per sentence, so exhaustive search and
+                    # CUDA graph capture (static shapes only) would not pay off
+                    "cudnn_conv_algo_search": "HEURISTIC",
+                    "cudnn_conv_use_max_workspace": "1",
+                    "do_copy_in_default_stream": True,
+                },
+            ),
+            "CPUExecutionProvider",
+        ]
+    else:
+        providers = ["CPUExecutionProvider"]
+
+    if use_cuda:
+        fp16_path = _fp16_model_path(model_path)
+        if fp16_path != model_path:
+            try:
+                return ort.InferenceSession(fp16_path, sess_options=opts, providers=providers)
+            except Exception:
+                # FP16 graphs can convert cleanly yet fail to load (type
+                # mismatches around RandomNormalLike/Range/Cast); drop the
+                # broken copy so it isn't reused, and use the original
+                Path(fp16_path).unlink(missing_ok=True)
+
+    return ort.InferenceSession(model_path, sess_options=opts, providers=providers)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_voice_cached(
+    model_path: str,
+    cfg_path: str,
+    use_cuda: bool,
+    model_mtime: int,
+    cfg_mtime: int,
+) -> PiperVoice:
+    """Load a Piper voice, reusing the ONNX session for unchanged files.
+
+    The mtimes are part of the cache key so replaced model files are reloaded.
+    Mirrors PiperVoice.load, but with our own session options.
+    """
+    from piper import PiperVoice
+    from piper.config import PiperConfig
+
+    with open(cfg_path, "r", encoding="utf-8") as f:
+        config = PiperConfig.from_dict(json.load(f))
+    voice = PiperVoice(config=config, session=_create_session(model_path, use_cuda))
+
+    # Warm up the session so first-run kernel/algorithm selection happens here
+    # instead of on the first Play
+    try:
+        for _ in voice.synthesize("Hi."):
+            pass
+    except Exception:
+        pass
+    return voice
+
+
 def load_voice_model(model_name: str, use_cuda: bool = False) -> tuple[PiperVoice | None, str]:
     """Load a Piper voice model. Returns (voice, status_message)."""
     if model_name == "No models":
@@ -87,23 +294,27 @@ def load_voice_model(model_name: str, use_cuda: bool = False) -> tuple[PiperVoic
 
     model_path = MODELS_DIR / model_name
     cfg_path = get_config_path(model_path)
+    files, _ = _scan_models_dir()
 
-    if not model_path.exists():
+    if model_path.name not in files:
         return None, f"Model not found: {model_name}"
 
-    if not cfg_path.exists():
+    if cfg_path.name not in files:
         return None, f"Missing config: {cfg_path.name}"
 
     try:
         # Load with CUDA if requested and available
-        voice = PiperVoice.load(
-            str(model_path), 
-            config_path=str(cfg_path),
-            use_cuda=use_cuda and is_cuda_available()
+        use_cuda = use_cuda and is_cuda_available()
+        voice = _load_voice_cached(
+            str(model_path),
+            str(cfg_path),
+            use_cuda,
+            model_path.stat().st_mtime_ns,
+            cfg_path.stat().st_mtime_ns,
         )
         
         sr = getattr(getattr(voice, "config", None), "sample_rate", None)
-        device = "CUDA" if (use_cuda and is_cuda_available()) else "CPU"
+        device = "CUDA" if use_cuda else "CPU"
         status = f"Loaded: {model_name} ({device})" + (f" @ {sr} Hz" if sr else "")
         return voice, status
     except Exception as e:
@@ -112,70 +323,131 @@ def load_voice_model(model_name: str, use_cuda: bool = False) -> tuple[PiperVoic
 
 def copy_model_files(file_paths: list[str]) -> int:
     """Copy model files to models directory. Returns count of copied files."""
-    copied = 0
-    for src in file_paths:
+    if not file_paths:
+        return 0
+
+    def copy_one(src: str) -> bool:
         try:
             shutil.copy2(src, MODELS_DIR / Path(src).name)
-            copied += 1
+            return True
         except Exception:
-            pass
-    return copied
+            return False
 
+    # One copy per destination name (last path wins, as with a serial loop);
+    # two threads writing the same file could interleave and corrupt it
+    sources = list({Path(src).name: src for src in file_paths}.values())
+
+    # shutil.copy2 releases the GIL during the kernel copy, so copies overlap
+    with ThreadPoolExecutor(max_workers=min(8, len(sources))) as pool:
+        return sum(pool.map(copy_one, sources))
+
+
+def download_voice_model(
+    voice_id: str, progress: Callable[[str], None] | None = None
+) -> tuple[bool, str]:
+    """Download a voice model and its config. Returns (success, message)."""
+    import piper.download_voices as piper_dl
+    from urllib.error import URLError
+    from urllib.request import urlopen
+
+    match = piper_dl.VOICE_PATTERN.match(voice_id)
+    if not match:
+        return False, f"Invalid voice ID: {voice_id} (expected e.g. en_GB-cori-high)"
+
+    # Piper's download_voice reports nothing per file and its urlopen calls
+    # take no timeout, so fetch from the same URLs here
+    url_args = match.groupdict()
+    url_args["lang_code"] = f"{url_args['lang_family']}_{url_args['lang_region']}"
 
-def download_voice_model(voice_id: str) -> tuple[bool, str]:
-    """Download a voice model. Returns (success, message)."""
-    argv0, out0, err0 = sys.argv, sys.stdout, sys.stderr
-    buf = io.StringIO()
-    
     try:
-        sys.argv = ["piper.download_voices", voice_id, "--data-dir", str(MODELS_DIR)]
-        sys.stdout = sys.stderr = buf
-        
-        try:
-            piper_dl.main()
-            ok = True
-        except SystemExit as se:
-            ok = (se.code or 0) == 0
-
-        text = buf.getvalue().strip()
-        if ok:
-            return True, f"Downloaded: {voice_id}"
-        return False, text or f"Download failed: {voice_id}"
-        
+        for ext in (".onnx", ".onnx.json"):
+            dest = MODELS_DIR / f"{voice_id}{ext}"
+            if dest.exists() and dest.stat().st_size > 0:
+                continue
+
+            if progress:
+                progress(f"Downloading: {dest.name}...")
+
+            # Write to a temp name so a failed download never looks like a model
+            part = dest.with_name(dest.name + ".part")
+            try:
+                url = piper_dl.URL_FORMAT.format(extension=ext, **url_args)
+                with urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response, open(part, "wb") as f:
+                    shutil.copyfileobj(response, f)
+                part.replace(dest)
+            finally:
+                part.unlink(missing_ok=True)
+
+        return True, f"Downloaded: {voice_id}"
+    except URLError as e:
+        return False, f"Download failed: {voice_id} ({e.reason})"
     except Exception as e:
         return False, f"Download error: {e}"
-    finally:
-        sys.argv, sys.stdout, sys.stderr = argv0, out0, err0
 
 
-def synthesize_to_wav(
-    voice: PiperVoice,
-    text: str,
-    output_path: str,
+def make_synthesis_config(
     volume: float = 1.0,
     speed: float = 1.0,
     noise: float = 0.667,
     noise_w: float = 0.8,
     normalize: bool = False,
-) -> tuple[bool, str]:
-    """Synthesize text to WAV file. Returns (success, message)."""
+) -> SynthesisConfig:
+    """Build a Piper synthesis config from UI parameters."""
+    from piper.config import SynthesisConfig
+
+    return SynthesisConfig(
+        volume=volume,
+        length_scale=speed,
+        noise_scale=noise,
+        noise_w_scale=noise_w,
+        normalize_audio=normalize,
+    )
+
+
+def write_wav(output_path: str, audio: np.ndarray, sample_rate: int) -> tuple[bool, str]:
+    """Write mono int16 audio to a WAV file. Returns (success, message)."""
     try:
-        cfg = SynthesisConfig(
-            volume=volume,
-            length_scale=speed,
-            noise_scale=noise,
-            noise_w_scale=noise_w,
-            normalize_audio=normalize,
-        )
-        
         with wave.open(output_path, "wb") as wf:
-            voice.synthesize_wav(text, wf, cfg)
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(sample_rate)
+            wf.writeframes(audio)
         
         return True, f"Saved: {Path(output_path).name}"
     except Exception as e:
         return False, f"Export error: {e}"
 
 
+def iter_synth_chunks(
+    voice: PiperVoice,
+    text: str,
+    cfg: SynthesisConfig,
+) -> Iterator[tuple[np.ndarray, int]]:
+    """Yield (audio_chunk, sample_rate) pairs as Piper synthesizes each sentence."""
+    sample_rate = voice.config.sample_rate
+
+    # Volume is applied on the int16 output rather than in Piper's float path
+    gain = cfg.volume
+    if gain != 1.0:
+        cfg = dataclasses.replace(cfg, volume=1.0)
+
+    for chunk in voice.synthesize(text, syn_config=cfg):
+        # Use the int16 array directly; audio_int16_bytes would copy it again
+        audio = chunk.audio_int16_array
+        if gain != 1.0:
+            audio = apply_gain_int16(audio, gain)
+        yield audio, sample_rate
+
+
+def apply_gain_int16(audio: np.ndarray, gain: float) -> np.ndarray:
+    """Scale int16 audio by a gain using Q16 fixed point with saturation."""
+    q = int(round(gain * 65536))
+    # int32 holds 32767 * 65536; louder gains need the wider type
+    wide = np.int32 if q <= 65536 else np.int64
+    scaled = (audio.astype(wide) * q) >> 16
+    return np.clip(scaled, -32768, 32767).astype(np.int16)
+
+
 def synthesize_to_audio_array(
     voice: PiperVoice,
     text: str,
@@ -187,57 +459,122 @@ def synthesize_to_audio_array(
 ) -> tuple[np.ndarray | None, int, str]:
     """Synthesize text to audio array. Returns (audio_data, sample_rate, status_message)."""
     try:
-        cfg = SynthesisConfig(
-            volume=volume,
-            length_scale=speed,
-            noise_scale=noise,
-            noise_w_scale=noise_w,
-            normalize_audio=normalize,
-        )
-        
-        # Synthesize to memory buffer
-        buf = io.BytesIO()
-        with wave.open(buf, "wb") as wf:
-            voice.synthesize_wav(text, wf, cfg)
-
-        # Read from memory buffer
-        buf.seek(0)
-        with wave.open(buf, "rb") as rf:
-            sample_rate = rf.getframerate()
-            raw = rf.readframes(rf.getnframes())
-        
-        audio = np.frombuffer(raw, dtype=np.int16)
-        return audio, sample_rate, "Success"
+        cfg = make_synthesis_config(volume, speed, noise, noise_w, normalize)
+        sample_rate = voice.config.sample_rate
+        estimate = int(len(text.split()) * SECONDS_PER_WORD * speed * sample_rate)
+        chunks = (audio for audio, _ in iter_synth_chunks(voice, text, cfg))
+        return collect_chunks(chunks, estimate), sample_rate, "Success"
         
     except Exception as e:
         return None, 0, f"Synthesis error: {e}"
 
 
+def collect_chunks(chunks: Iterable[np.ndarray], estimate: int) -> np.ndarray:
+    """Join int16 chunks into one array, writing into a preallocated buffer.
+
+    Falls back to np.concatenate for whatever does not fit the estimate.
+    """
+    out = np.empty(max(estimate, 0), dtype=np.int16)
+    pos = 0
+    overflow: list[np.ndarray] = []
+    for chunk in chunks:
+        end = pos + len(chunk)
+        if overflow or end > len(out):
+            overflow.append(chunk)
+            continue
+        out[pos:end] = chunk
+        pos = end
+
+    if overflow:
+        return np.concatenate([out[:pos], *overflow])
+
+    # Shrink in place; the buffer has no other references
+    out.resize(pos, refcheck=False)
+    return out
+
+
 class AudioPlayer:
-    """Simple audio player using sounddevice."""
+    """Audio player writing to a persistent sounddevice output stream."""
     
     def __init__(self) -> None:
         self.playing = False
         self.stopped = False
+        self._stream: sd.OutputStream | None = None
+    
+    def _get_stream(self, sample_rate: int) -> sd.OutputStream:
+        """Return a started output stream, reopening it only if the rate changed."""
+        import sounddevice as sd
+
+        stream = self._stream
+        if stream is not None and stream.samplerate != sample_rate:
+            stream.close()
+            stream = None
+        
+        if stream is None:
+            stream = sd.OutputStream(
+                samplerate=sample_rate,
+                channels=1,
+                dtype="int16",
+                blocksize=AUDIO_BLOCKSIZE,
+                latency=AUDIO_LATENCY,
+            )
+            self._stream = stream
+        
+        if not stream.active:
+            stream.start()
+        return stream
+    
+    def play(self, audio_data: np.ndarray, sample_rate: int) -> bool:
+        """Play audio data. Blocks until finished; returns True if stopped by user."""
+        return self.play_stream([(audio_data, sample_rate)])
     
-    def play(self, audio_data: np.ndarray, sample_rate: int) -> None:
-        """Play audio data."""
+    def play_stream(self, chunks: Iterable[tuple[np.ndarray, int]]) -> bool:
+        """Write audio chunks to the output device as they arrive.
+
+        Blocks until playback finishes. Returns True if stopped by user.
+        """
+        import sounddevice as sd
+
         self.playing = True
         self.stopped = False
-        sd.play(audio_data, samplerate=sample_rate, blocking=False)
+        stream = None
+        try:
+            for audio, sample_rate in chunks:
+                if self.stopped:
+                    break
+                stream = self._get_stream(sample_rate)
+                stream.write(audio.reshape(-1, 1))
+
+            if stream is not None and not self.stopped:
+                # Drain buffered audio; the stream stays open for reuse
+                stream.stop()
+        except sd.PortAudioError:
+            # write() fails once the stream is aborted by stop()
+            if not self.stopped:
+                raise
+        finally:
+            self.playing = False
+        return self.stopped
     
     def stop(self) -> None:
         """Stop playback."""
         if self.playing:
             self.stopped = True
-            sd.stop()
-            self.playing = False
+            stream = self._stream
+            if stream is not None:
+                import sounddevice as sd
+
+                try:
+                    stream.abort()
+                except sd.PortAudioError:
+                    pass
     
-    def wait(self) -> bool:
-        """Wait for playback to finish. Returns True if stopped by user."""
-        sd.wait()
-        self.playing = False
-        return self.stopped
+    def close(self) -> None:
+        """Stop playback and release the output device."""
+        self.stop()
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
     
     def is_playing(self) -> bool:
         """Check if audio is currently playing."""
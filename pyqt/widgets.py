@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -15,6 +15,8 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from .theme import CARD_STYLE, TITLE_TEXT, style_label
+
 
 @dataclass(frozen=True)
 class SliderConfig:
@@ -32,9 +34,13 @@ class FloatSlider(QWidget):
 
     valueChanged = pyqtSignal(float)
 
+    # Delay before valueChanged fires after the last slider movement
+    DEBOUNCE_MS = 50
+
     def __init__(self, config: SliderConfig, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.config = config
+        self._inv_step = 1.0 / config.step
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -48,7 +54,7 @@ class FloatSlider(QWidget):
         self.slider.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed
         )
-        steps = int((config.max_val - config.min_val) / config.step)
+        steps = round((config.max_val - config.min_val) * self._inv_step)
         self.slider.setRange(0, steps)
         self.slider.valueChanged.connect(self._on_change)
         layout.addWidget(self.slider, 1)
@@ -58,6 +64,12 @@ class FloatSlider(QWidget):
         self.display.setFixedWidth(40)
         layout.addWidget(self.display)
 
+        # Coalesce drag ticks into a single valueChanged emission
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(lambda: self.valueChanged.emit(self.value()))
+
         self.set_value(config.default)
 
     def value(self) -> float:
@@ -67,26 +79,27 @@ class FloatSlider(QWidget):
     def set_value(self, val: float) -> None:
         """Set float value."""
         val = max(self.config.min_val, min(self.config.max_val, val))
-        steps = int((val - self.config.min_val) / self.config.step)
+        steps = round((val - self.config.min_val) * self._inv_step)
         self.slider.blockSignals(True)
         self.slider.setValue(steps)
         self.slider.blockSignals(False)
-        self._update_display()
+        self._update_display(self.value())
 
-    def _on_change(self) -> None:
+    def _on_change(self, pos: int) -> None:
         """Handle slider value change."""
-        self._update_display()
-        self.valueChanged.emit(self.value())
+        self._update_display(self.config.min_val + pos * self.config.step)
+        self._debounce.start()
 
-    def _update_display(self) -> None:
+    def _update_display(self, v: float) -> None:
         """Update value display label."""
-        self.display.setText(f"{self.value():.2f}")
+        self.display.setText(f"{v:.2f}")
 
 
 class Card(QFrame):
     def __init__(self, title: str, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setObjectName("Card")
+        self.setStyleSheet(CARD_STYLE)
 
         self._card_layout = QVBoxLayout(self)
         self._card_layout.setContentsMargins(10, 10, 10, 10)
@@ -94,6 +107,7 @@ class Card(QFrame):
 
         title_label = QLabel(title)
         title_label.setObjectName("CardTitle")
+        style_label(title_label, 11, bold=True, color=TITLE_TEXT, uppercase=True)
         self._card_layout.addWidget(title_label)
 
     def add_widget(self, widget: QWidget) -> None:
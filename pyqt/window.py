@@ -2,11 +2,16 @@
 """Main application window."""
 from __future__ import annotations
 
+import queue
+import re
 import threading
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Iterator
 
-from PyQt6.QtCore import Qt, QObject, pyqtSignal
+import numpy as np
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import (
+    QApplication,
     QCheckBox,
     QComboBox,
     QFileDialog,
@@ -23,14 +28,18 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from .theme import DIM_TEXT, LOG_VIEW_STYLE, style_label
 from .widgets import Card, FloatSlider, SliderConfig
 from functions import (
     list_models,
     load_voice_model,
     copy_model_files,
     download_voice_model,
-    synthesize_to_wav,
+    quantize_voice_model,
     synthesize_to_audio_array,
+    write_wav,
+    iter_synth_chunks,
+    make_synthesis_config,
     AudioPlayer,
     is_cuda_available,
     get_cuda_info,
@@ -39,6 +48,10 @@ from functions import (
 if TYPE_CHECKING:
     from PyQt6.QtGui import QCloseEvent
     from piper import PiperVoice
+    from piper.config import SynthesisConfig
+
+# Sentence boundaries for look-ahead synthesis (punctuation stays with its sentence)
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
 
 
 class WorkerSignals(QObject):
@@ -48,6 +61,30 @@ class WorkerSignals(QObject):
     status = pyqtSignal(str)
 
 
+class WorkerRunnable(QRunnable):
+    """Run a callable on a QThreadPool thread."""
+
+    def __init__(self, fn: Callable[[], None]) -> None:
+        super().__init__()
+        self._fn = fn
+
+    def run(self) -> None:
+        self._fn()
+
+
+def detached_pool(max_threads: int) -> QThreadPool:
+    """Create a thread pool that is never destroyed.
+
+    QThreadPool's destructor waits for running tasks while holding the GIL,
+    which deadlocks if Python work (a download, a long sentence) is still
+    running at teardown. Ownership goes to C++ with no parent instead.
+    """
+    pool = QThreadPool()
+    pool.setMaxThreadCount(max_threads)
+    sip.transferto(pool, None)
+    return pool
+
+
 class MainWindow(QMainWindow):
     """Main application window."""
 
@@ -59,8 +96,27 @@ class MainWindow(QMainWindow):
 
         self.voice: PiperVoice | None = None
         self.audio_player = AudioPlayer()
-        self.workers: list[QObject] = []
         self.use_cuda = False  # CUDA preference
+        # Last synthesized (voice, text, params, audio, sample_rate), reused by
+        # Export/Play when nothing changed; only touched by the worker thread
+        self._last_audio: tuple | None = None
+        self._clipboard = QApplication.clipboard()
+
+        # Single background worker for synthesis/playback; commands run in the
+        # order they are queued. Downloads and quantizing use their own thread.
+        # Worker signals are only ever emitted from pool threads. Not parented
+        # to the window: a command may still finish after the window is gone.
+        queued = Qt.ConnectionType.QueuedConnection
+        self._closing = False
+        self._signals = WorkerSignals()
+        self._signals.finished.connect(self._on_worker_finished, queued)
+        self._signals.error.connect(self._set_status, queued)
+        self._signals.status.connect(self._set_status, queued)
+        self._cmd_q: queue.Queue[tuple] = queue.Queue()
+        # One thread for the command loop, one for look-ahead synthesis
+        self._pool = detached_pool(2)
+        self._io_pool = detached_pool(1)
+        self._pool.start(WorkerRunnable(self._worker_loop))
 
         self._build_ui()
         self._check_cuda()
@@ -88,6 +144,7 @@ class MainWindow(QMainWindow):
 
         title = QLabel("Voice Model")
         title.setObjectName("AppTitle")
+        style_label(title, 16, bold=True)
         header.addWidget(title)
 
         self.model_combo = QComboBox()
@@ -108,6 +165,12 @@ class MainWindow(QMainWindow):
         dl_btn.clicked.connect(self._download_voice)
         header.addWidget(dl_btn)
 
+        quant_btn = QToolButton()
+        quant_btn.setText("⚡")
+        quant_btn.setToolTip("Create INT8 quantized copy of model")
+        quant_btn.clicked.connect(self._quantize_model)
+        header.addWidget(quant_btn)
+
         refresh_btn = QToolButton()
         refresh_btn.setText("⟳")
         refresh_btn.setToolTip("Refresh models")
@@ -124,6 +187,7 @@ class MainWindow(QMainWindow):
 
         self.status_label = QLabel("Ready")
         self.status_label.setObjectName("DimText")
+        style_label(self.status_label, 12, color=DIM_TEXT)
         header.addWidget(self.status_label)
 
         return header
@@ -203,6 +267,7 @@ class MainWindow(QMainWindow):
         self.log.setMinimumHeight(80)
         self.log.setMaximumHeight(100)
         self.log.setObjectName("LogView")
+        self.log.setStyleSheet(LOG_VIEW_STYLE)
         card.add_widget(self.log)
 
         return card
@@ -214,19 +279,20 @@ class MainWindow(QMainWindow):
 
     def _copy_log(self) -> None:
         """Copy log to clipboard."""
-        from PyQt6.QtWidgets import QApplication
-        cb = QApplication.clipboard()
-        if cb:
-            cb.setText(self.log.toPlainText())
+        if self._clipboard:
+            self._clipboard.setText(self.log.toPlainText())
 
     def _clear_log(self) -> None:
         """Clear status log."""
         self.log.clear()
 
     def _check_cuda(self) -> None:
-        """Check CUDA availability and update UI."""
-        cuda_info = get_cuda_info()
-        
+        """Check CUDA availability in the background."""
+        self.cuda_checkbox.setEnabled(False)
+        self._cmd_q.put(("cuda_check",))
+
+    def _on_cuda_checked(self, cuda_info: dict) -> None:
+        """Update UI with CUDA availability."""
         if cuda_info["available"]:
             self.cuda_checkbox.setEnabled(True)
             device_info = cuda_info.get("device", "Unknown GPU")
@@ -255,31 +321,51 @@ class MainWindow(QMainWindow):
     def _on_model_changed(self, model_name: str) -> None:
         """Handle model selection change."""
         self._set_status(f"Loading: {model_name}...")
-
-        use_cuda = self.use_cuda
-
-        def worker():
-            voice, status = load_voice_model(model_name, use_cuda)
-            return voice, status
-
-        signals = WorkerSignals()
-        signals.finished.connect(self._on_model_loaded)
-        
-        def run_worker():
+        self._cmd_q.put(("load", model_name, self.use_cuda))
+
+    def _worker_loop(self) -> None:
+        """Run queued background commands one at a time."""
+        handlers = {
+            "load": self._do_load,
+            "synth_play": self._do_synth_play,
+            "export": self._do_export,
+            "cuda_check": get_cuda_info,
+        }
+        while not self._closing:
+            cmd, *args = self._cmd_q.get()
+            if cmd == "quit" or self._closing:
+                return
             try:
-                result = worker()
-                signals.finished.emit(result)
+                result = handlers[cmd](*args)
             except Exception as e:
-                signals.error.emit(str(e))
-
-        self.workers.append(signals)
-        threading.Thread(target=run_worker, daemon=True).start()
+                self._emit("error", str(e))
+                if cmd != "synth_play":
+                    continue
+                result = (True, f"Playback error: {e}")
+            self._emit("finished", (cmd, result))
+
+    def _emit(self, signal: str, value: object) -> None:
+        """Emit a worker signal, unless the window is closing."""
+        if not self._closing:
+            getattr(self._signals, signal).emit(value)
+
+    def _on_worker_finished(self, payload: tuple) -> None:
+        """Dispatch a finished background command to its handler."""
+        cmd, result = payload
+        if cmd in ("download", "quantize"):
+            self._on_download_complete(result)
+        elif cmd == "synth_play":
+            self._on_playback_complete(result)
+        elif cmd == "cuda_check":
+            self._on_cuda_checked(result)
+        else:
+            self._set_status(result[1])
 
-    def _on_model_loaded(self, result: tuple) -> None:
-        """Handle model loading completion."""
-        voice, status = result
+    def _do_load(self, model_name: str, use_cuda: bool) -> tuple[bool, str]:
+        """Load a voice model (worker thread)."""
+        voice, status = load_voice_model(model_name, use_cuda)
         self.voice = voice
-        self._set_status(status)
+        return voice is not None, status
 
     def _refresh_models(self) -> None:
         current = self.model_combo.currentText()
@@ -326,25 +412,35 @@ class MainWindow(QMainWindow):
 
         voice_id = voice_id.strip()
         self._set_status(f"Downloading: {voice_id}...")
+        self._start_io("download", self._do_download, voice_id)
+
+    def _quantize_model(self) -> None:
+        """Create an INT8 quantized copy of the selected model."""
+        model_name = self.model_combo.currentText()
+        if model_name in ("", "No models"):
+            self._set_status("Select a model to quantize")
+            return
 
-        def worker():
-            return download_voice_model(voice_id)
+        self._set_status(f"Quantizing: {model_name}...")
+        self._start_io("quantize", quantize_voice_model, model_name)
 
-        signals = WorkerSignals()
-        signals.finished.connect(self._on_download_complete)
-        
-        def run_worker():
+    def _start_io(self, cmd: str, fn: Callable[[str], tuple[bool, str]], arg: str) -> None:
+        """Run a long file job off the synthesis worker so playback stays responsive."""
+        def run() -> None:
             try:
-                result = worker()
-                signals.finished.emit(result)
+                result = fn(arg)
             except Exception as e:
-                signals.error.emit(str(e))
+                result = (False, f"{cmd.capitalize()} error: {e}")
+            self._emit("finished", (cmd, result))
+
+        self._io_pool.start(WorkerRunnable(run))
 
-        self.workers.append(signals)
-        threading.Thread(target=run_worker, daemon=True).start()
+    def _do_download(self, voice_id: str) -> tuple[bool, str]:
+        """Download a voice model, reporting each file (worker thread)."""
+        return download_voice_model(voice_id, lambda msg: self._emit("status", msg))
 
     def _on_download_complete(self, result: tuple) -> None:
-        """Handle download completion."""
+        """Handle download or quantize completion."""
         success, message = result
         self._set_status(message)
         if success:
@@ -372,32 +468,45 @@ class MainWindow(QMainWindow):
             return
 
         self._set_status("Generating WAV...")
+        self._cmd_q.put(("export", text, file_path, self._synthesis_params()))
 
+    def _do_export(self, text: str, file_path: str, params: tuple) -> tuple[bool, str]:
+        """Synthesize text to a WAV file (worker thread)."""
         voice = self.voice
-        volume = self.volume.value()
-        speed = self.speed.value()
-        noise = self.noise.value()
-        noise_w = self.noise_w.value()
-        normalize = self.normalize.isChecked()
-
-        def worker():
-            return synthesize_to_wav(
-                voice, text, file_path,
-                volume, speed, noise, noise_w, normalize
-            )
-
-        signals = WorkerSignals()
-        signals.finished.connect(lambda r: self._set_status(r[1]))
-        
-        def run_worker():
-            try:
-                result = worker()
-                signals.finished.emit(result)
-            except Exception as e:
-                signals.error.emit(str(e))
+        if not voice:
+            return False, "Load a voice model first"
 
-        self.workers.append(signals)
-        threading.Thread(target=run_worker, daemon=True).start()
+        cached = self._cached_audio(voice, text, params)
+        if cached:
+            audio, sample_rate = cached
+        else:
+            audio, sample_rate, status = synthesize_to_audio_array(voice, text, *params)
+            if audio is None:
+                return False, status
+            self._last_audio = (voice, text, params, audio, sample_rate)
+
+        return write_wav(file_path, audio, sample_rate)
+
+    def _cached_audio(
+        self, voice: PiperVoice, text: str, params: tuple
+    ) -> tuple[np.ndarray, int] | None:
+        """Return previously synthesized audio for the same request, if any."""
+        if self._last_audio is None:
+            return None
+        last_voice, last_text, last_params, audio, sample_rate = self._last_audio
+        if last_voice is voice and last_text == text and last_params == params:
+            return audio, sample_rate
+        return None
+
+    def _synthesis_params(self) -> tuple[float, float, float, float, bool]:
+        """Snapshot current slider settings for a background command."""
+        return (
+            self.volume.value(),
+            self.speed.value(),
+            self.noise.value(),
+            self.noise_w.value(),
+            self.normalize.isChecked(),
+        )
 
     def _play_stop(self) -> None:
         """Play or stop audio."""
@@ -421,43 +530,85 @@ class MainWindow(QMainWindow):
         self.play_btn.setText("■ Stop")
         self.play_btn.setEnabled(True)
 
+        self._cmd_q.put(("synth_play", text, self._synthesis_params()))
+
+    def _do_synth_play(self, text: str, params: tuple) -> tuple[bool, str]:
+        """Synthesize and play text (worker thread)."""
         voice = self.voice
-        volume = self.volume.value()
-        speed = self.speed.value()
-        noise = self.noise.value()
-        noise_w = self.noise_w.value()
-        normalize = self.normalize.isChecked()
-
-        def worker():
-            # Synthesize
-            audio, sample_rate, status = synthesize_to_audio_array(
-                voice, text, volume, speed, noise, noise_w, normalize
-            )
-            
-            if audio is None:
-                return False, status
+        if not voice:
+            return False, "Load a voice model first"
 
-            # Play
-            self.audio_player.play(audio, sample_rate)
-            stopped = self.audio_player.wait()
-            
+        self._emit("status", "Playing...")
+
+        cached = self._cached_audio(voice, text, params)
+        if cached:
+            stopped = self.audio_player.play(*cached)
             return stopped, "Stopped" if stopped else "Playback complete"
 
-        signals = WorkerSignals()
-        signals.status.connect(self._set_status)
-        signals.finished.connect(self._on_playback_complete)
+        cfg = make_synthesis_config(*params)
+        played: list[np.ndarray] = []
+
+        def record(chunks):
+            for audio, sample_rate in chunks:
+                played.append(audio)
+                yield audio, sample_rate
+
+        # Play each sentence while the next one is synthesized
+        chunks = self._synth_lookahead(voice, text, cfg)
+        stopped = self.audio_player.play_stream(record(chunks))
+
+        if not stopped and played:
+            audio = np.concatenate(played)
+            self._last_audio = (voice, text, params, audio, voice.config.sample_rate)
         
-        def run_worker():
+        return stopped, "Stopped" if stopped else "Playback complete"
+
+    def _synth_lookahead(
+        self, voice: PiperVoice, text: str, cfg: SynthesisConfig
+    ) -> Iterator[tuple[np.ndarray, int]]:
+        """Yield synthesized sentences, keeping one sentence synthesized ahead."""
+        player = self.audio_player
+        buffer: queue.Queue = queue.Queue(maxsize=1)
+        done = threading.Event()
+
+        def put(item: object) -> bool:
+            # Block while the buffer is full, but give up once playback ends
+            while not (player.stopped or done.is_set() or self._closing):
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def producer():
             try:
-                signals.status.emit("Playing...")
-                result = worker()
-                signals.finished.emit(result)
+                for sentence in SENTENCE_END.split(text):
+                    if self._closing:
+                        return
+                    for item in iter_synth_chunks(voice, sentence, cfg):
+                        if not put(item):
+                            return
             except Exception as e:
-                signals.error.emit(str(e))
-                signals.finished.emit((True, f"Playback error: {e}"))
-
-        self.workers.append(signals)
-        threading.Thread(target=run_worker, daemon=True).start()
+                put(e)
+            finally:
+                put(None)
+
+        # Started lazily so player.stopped has been reset by play_stream
+        self._pool.start(WorkerRunnable(producer))
+        try:
+            while not (player.stopped or self._closing):
+                try:
+                    item = buffer.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            done.set()
 
     def _stop_playback(self) -> None:
         """Stop audio playback."""
@@ -472,5 +623,10 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event: QCloseEvent) -> None:
         """Handle window close event."""
-        self.audio_player.stop()
+        self._closing = True
+        self.audio_player.close()
+        self._cmd_q.put(("quit",))
+        # Cancellable work winds down quickly; anything still running (e.g. a
+        # single long sentence) is left to finish in its detached pool
+        self._pool.waitForDone(500)
         event.accept()